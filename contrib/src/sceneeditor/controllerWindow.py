@@ -3,15 +3,95 @@
 # Written by Yi-Hong Lin, yihhongl@andrew.cmu.edu, 2004
 #################################################################
 
+# sceneEditor star-imports this module, so keep the imported tkinter.ttk
+# classes and the module logger from leaking into its namespace.
+__all__ = ['KEYBOARD', 'TRACKER', 'KEYBOARD_ROWS',
+           'controllerWindow', 'getOrCreateControllerWindow']
+
 from direct.tkwidgets.AppShell import AppShell
+from direct.task import Task
 import Pmw
-from tkinter import Frame, Label, Button
-import tkinter
+import logging
+from tkinter import W, LEFT, RIGHT, TOP, BOTTOM, X, BOTH, DISABLED
+# The plain containers and decorations use the themed ttk widgets, which
+# render natively (and cheaper) on Windows and macOS. The Pmw megawidgets
+# keep wrapping classic Tk internally.
+from tkinter.ttk import Frame, Label, Button
+
+logger = logging.getLogger(__name__)
 
 # Define the Category
 KEYBOARD = 'Keyboard-'
 TRACKER = 'Tarcker-'
 
+# Row specification for the keyboard setting page.
+# Each entry is (row label, keyboardMapDict key, keyboardSpeedDict key).
+KEYBOARD_ROWS = (('Forward   :', 'KeyForward', 'SpeedForward'),
+                 ('Backward  :', 'KeyBackward', 'SpeedBackward'),
+                 ('Right     :', 'KeyRight', 'SpeedRight'),
+                 ('Left      :', 'KeyLeft', 'SpeedLeft'),
+                 ('Up        :', 'KeyUp', 'SpeedUp'),
+                 ('Down      :', 'KeyDown', 'SpeedDown'),
+                 ('Turn Right:', 'KeyTurnRight', 'SpeedTurnRight'),
+                 ('Turn Left :', 'KeyTurnLeft', 'SpeedTurnLeft'),
+                 ('Turn UP   :', 'KeyTurnUp', 'SpeedTurnUp'),
+                 ('Turn Down :', 'KeyTurnDown', 'SpeedTurnDown'),
+                 ('Roll Right:', 'KeyRollRight', 'SpeedRollRight'),
+                 ('Roll Left :', 'KeyRollLeft', 'SpeedRollLeft'),
+                 ('Scale UP :', 'KeyScaleUp', 'SpeedScaleUp'),
+                 ('Scale Down:', 'KeyScaleDown', 'SpeedScaleDown'),
+                 ('Scale X UP :', 'KeyScaleXUp', 'SpeedScaleXUp'),
+                 ('Scale X Down:', 'KeyScaleXDown', 'SpeedScaleXDown'),
+                 ('Scale Y UP :', 'KeyScaleYUp', 'SpeedScaleYUp'),
+                 ('Scale Y Down:', 'KeyScaleYDown', 'SpeedScaleYDown'),
+                 ('Scale Z UP :', 'KeyScaleZUp', 'SpeedScaleZUp'),
+                 ('Scale Z Down:', 'KeyScaleZDown', 'SpeedScaleZDown'))
+
+# Common Pmw.EntryField options shared by every key/speed entry on the
+# keyboard page. Built once here so _makeKeyRow doesn't rebuild the same
+# keyword dict for each of the entries it creates.
+_KEY_OPTS = dict(labelpos = W, label_text = 'Key :', entry_width = 10)
+_SPEED_OPTS = dict(labelpos = W, label_text = 'Speed (per sec):', entry_width = 10)
+
+def _keepValue(value, previous):
+    # Cast used for the key entries: the string is stored as typed.
+    return value
+
+def _floatOrElse(value, previous):
+    #################################################################
+    # _floatOrElse(value, previous)
+    # Parse a speed entry's value. The speed entries deliberately carry
+    # no Pmw 'real' validator (that would cost a Tcl callback on every
+    # keystroke in each of the 20 fields); bad input is caught here at
+    # collection time and falls back to the previous speed instead.
+    #################################################################
+    try:
+        return float(value)
+    except ValueError:
+        return previous
+
+# The last panel built, kept alive (hidden) after the user closes it so
+# that reopening only has to refresh the entry values instead of
+# recreating the whole widget tree. See getOrCreateControllerWindow.
+_controllerPanelCache = None
+
+def getOrCreateControllerWindow(listOfObj, controlType, dataList):
+    #################################################################
+    # getOrCreateControllerWindow(listOfObj, controlType, dataList)
+    # Return a controller panel showing the given setting.
+    # If a previously opened panel is still alive (closing the panel
+    # only hides it), reuse it and just refresh its widgets; otherwise
+    # build a new one. This makes reopening the panel essentially free.
+    #################################################################
+    global _controllerPanelCache
+    panel = _controllerPanelCache
+    if panel is not None and panel.parent.winfo_exists():
+        panel.showPanel(listOfObj, controlType, dataList)
+        return panel
+    panel = controllerWindow(listOfObj = listOfObj, controlType = controlType, dataList = dataList)
+    _controllerPanelCache = panel
+    return panel
+
 class controllerWindow(AppShell):
     #################################################################
     # This will open a talk window for user to set the control mechanism
@@ -23,29 +103,60 @@ class controllerWindow(AppShell):
     frameWidth  = 500
     frameHeight = 500
 
-    widgetsDict = {} # category-id : widget obj
-
     # setup the type of controller we handle here.
     controllerList = ['Keyboard',
                       'Tracker']
 
-    # Default Keyboard setting
-    keyboardMapDict = {}
-    keyboardSpeedDict = {}
+    # controller type : setting page shown for it. A dict lookup keeps
+    # setControllerType O(1) as controller types get added.
+    _PAGE_FOR_TYPE = {'Keyboard': 'Keyboard',
+                      'Tracker': 'Tracker'}
 
     def __init__(self, listOfObj, controlType , dataList, parent = None, **kw):
+        self.widgetsDict = {} # category-id : widget obj
+
+        # Direct references to the key/speed entries on the keyboard page,
+        # keyed by the keyboardMapDict/keyboardSpeedDict keys. Filled in by
+        # _makeKeyRow; used by the data-collection loops so they don't have
+        # to rebuild 'Keyboard-'+key strings for every lookup.
+        self._mapWidgets = {}
+        self._speedWidgets = {}
+
+        # Keyboard setting
+        self.keyboardMapDict = {}
+        self.keyboardSpeedDict = {}
         if controlType == 'Keyboard':
             self.nodePath = dataList[0] # Default setting -> mainly used for Keyboard control now.
             self.nameOfNode = self.nodePath.getName()
             self.controllType = 'Keyboard'
-            self.keyboardMapDict.clear()
-            self.keyboardMapDict = dataList[1]
-            self.keyboardSpeedDict.clear()
-            self.keyboardSpeedDict = dataList[2]
+            # Copy the incoming dicts, so edits made on the panel don't
+            # leak back into the caller's setting until it asks for them.
+            self.keyboardMapDict = dict(dataList[1])
+            self.keyboardSpeedDict = dict(dataList[2])
 
         self.listOfObj = listOfObj
         self.keepControl = False
 
+        # Set as soon as the user edits any entry or enables control;
+        # onDestroy only tears the control task down when there is
+        # actually something to tear down.
+        self._dirty = False
+
+        # Pending-dispatch flags: repeated Save/Enable clicks within one
+        # frame collapse into a single gather+send (see _flushSave and
+        # _flushEnable).
+        self._savePending = False
+        self._enablePending = False
+
+        # Snapshot of the object-name list last pushed into the combo box,
+        # used by resetNameList to skip rebuilding an unchanged list.
+        self._lastNameList = None
+
+        # event name : bound method. The receivers of the panel's events
+        # are one-to-one edges into sceneEditor; it may register a direct
+        # callback here so _dispatch can skip the messenger machinery.
+        self._directListeners = {}
+
         INITOPT = Pmw.INITOPT
         optiondefs = (
             ('title',               self.appname,       None),
@@ -61,6 +172,11 @@ class controllerWindow(AppShell):
         self.parent.resizable(False,False) ## Disable the ability to resize for this Window.
 
     def createInterface(self):
+        # Keep the toplevel withdrawn while the interface is built, so Tk
+        # doesn't run a geometry pass for every widget we pack. One
+        # update_idletasks() at the end lays the whole form out in one go.
+        self.parent.withdraw()
+
         # Handle to the toplevels interior
         interior = self.interior()
         menuBar = self.menuBar
@@ -76,12 +192,15 @@ class controllerWindow(AppShell):
         self.cotrollerTypeEntry = self.createcomponent(
             'Controller Type', (), None,
             Pmw.ComboBox, (frame,),
-            labelpos = tkinter.W, label_text='Controller Type:', entry_width = 20,entry_state = tkinter.DISABLED,
+            labelpos = W, label_text='Controller Type:', entry_width = 20,entry_state = DISABLED,
             selectioncommand = self.setControllerType,
             scrolledlist_items = self.controllerList)
-        self.cotrollerTypeEntry.pack(side=tkinter.LEFT)
-        frame.pack(side=tkinter.TOP, fill=tkinter.X, expand=False, pady = 3)
-        self.cotrollerTypeEntry.selectitem('Keyboard', setentry=True)
+        self.cotrollerTypeEntry.pack(side=LEFT)
+        frame.pack(side=TOP, fill=X, expand=False, pady = 3)
+        # Setting the entry fires the selectioncommand; defer it until the
+        # mainloop is idle so it doesn't run in the middle of the build.
+        self.parent.after_idle(
+            lambda: self.cotrollerTypeEntry.selectitem('Keyboard', setentry=True))
 
         self.inputZone = Pmw.Group(mainFrame, tag_pyclass = None)
         self.inputZone.pack(fill='both',expand=1)
@@ -98,14 +217,19 @@ class controllerWindow(AppShell):
             usehullsize = 1)
         self.contentFrame = self.contentWidge.component('frame')
         self.contentWidge.pack(fill = 'both', expand = 1,padx = 3, pady = 5)
-        self.objNotebook = Pmw.NoteBook(self.contentFrame, tabpos = None,
-                                        borderwidth = 0)
-        keyboardPage = self.objNotebook.add('Keyboard')
-        tarckerPage = self.objNotebook.add('Tracker')
-        self.objNotebook.selectpage('Keyboard')
-        self.objNotebook.pack(side = tkinter.TOP, fill='both',expand=False)
-        # Put this here so it isn't called right away
-        self.objNotebook['raisecommand'] = self.updateControlInfo
+        # The notebook used here never showed its tabs (tabpos = None) and
+        # pages were only ever switched programmatically, so plain Frames
+        # packed and unpacked by _selectPage do the same job without the
+        # Pmw.NoteBook construction overhead.
+        self._pages = {}
+        keyboardPage = Frame(self.contentFrame)
+        self._pages['Keyboard'] = keyboardPage
+        # The Tracker page is created on demand the first time the user
+        # switches to it, so don't pay for it when the panel is only used
+        # in Keyboard mode.
+        self._trackerBuilt = False
+        self._currentPage = None
+        self._selectPage('Keyboard')
 
         # Keyboard  setting
         assignFrame = Frame(keyboardPage)
@@ -114,442 +238,162 @@ class controllerWindow(AppShell):
         widget = self.createcomponent(
             'Target Type', (), None,
             Pmw.ComboBox, (Interior,),
-            labelpos = tkinter.W, label_text='Target Object:', entry_width = 20, entry_state = tkinter.DISABLED,
+            labelpos = W, label_text='Target Object:', entry_width = 20, entry_state = DISABLED,
             selectioncommand = self.setTargetObj,
             scrolledlist_items = self.listOfObj)
-        widget.pack(side=tkinter.LEFT, padx=3)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 5)
-        widget.selectitem(self.nameOfNode, setentry=True)
+        widget.pack(side=LEFT, padx=3)
+        Interior.pack(side=TOP, fill=X, expand=True, pady = 5)
+        # Deferred for the same reason as the controller-type combo above.
+        self.parent.after_idle(
+            lambda w = widget: w.selectitem(self.nameOfNode, setentry=True))
         self.widgetsDict[KEYBOARD+'ObjList'] = widget
+        # Direct reference, so the users of the object list don't have to
+        # go through a widgetsDict lookup with a composed key.
+        self._objListEntry = widget
 
         inputZone = Pmw.Group(assignFrame, tag_pyclass = None)
         inputZone.pack(fill='both',expand=1)
         settingFrame = inputZone.interior()
 
         Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Assign a Key For:').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True,pady = 6 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Forward   :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Forward key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyForward'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyForward'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Forward Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedForward'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedForward'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Backward  :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Backward key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyBackward'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyBackward'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Backward Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedBackward'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedBackward'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Right     :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Right key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyRight'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyRight'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Right Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedRight'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedRight'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Left      :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Left key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyLeft'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyLeft'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Left Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedLeft'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedLeft'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Up        :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Up key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyUp'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyUp'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Up Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedUp'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedUp'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Down      :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Down key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyDown'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyDown'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Down Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedDown'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedDown'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
+        Label(Interior, text = 'Assign a Key For:').pack(side=LEFT, expand = False)
+        Interior.pack(side=TOP, fill=X, expand=True,pady = 6 )
 
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Turn Right:', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Turn Right key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyTurnRight'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyTurnRight'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Turn Right Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedTurnRight'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedTurnRight'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
+        # One shared container laid out with grid, instead of a throwaway
+        # Frame packed for each row.
+        gridFrame = Frame(settingFrame)
+        for row, (labelText, keyKey, speedKey) in enumerate(KEYBOARD_ROWS):
+            self._makeKeyRow(gridFrame, row, labelText, keyKey, speedKey)
+        # Packed only after all rows are gridded, so the form joins the
+        # managed widget tree in a single geometry pass instead of
+        # propagating once per row.
+        gridFrame.pack(side=TOP, fill=X, expand=True)
 
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Turn Left :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Turn Left key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyTurnLeft'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyTurnLeft'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Turn Left Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedTurnLeft'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedTurnLeft'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
+        assignFrame.pack(side=TOP, expand=True, fill = X)
 
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Turn UP   :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Turn UP key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyTurnUp'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyTurnUp'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Turn UP Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedTurnUp'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedTurnUp'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Turn Down :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Turn Down key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyTurnDown'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyTurnDown'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Turn Down Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedTurnDown'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedTurnDown'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Roll Right:', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Roll Right key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyRollRight'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyRollRight'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Roll Right Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedRollRight'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedRollRight'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Roll Left :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Roll Left key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyRollLeft'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyRollLeft'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Roll Left Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedRollLeft'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedRollLeft'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Scale UP :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale UP key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyScaleUp'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyScaleUp'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale UP Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedScaleUp'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedScaleUp'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Scale Down:', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Down key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyScaleDown'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyScaleDown'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Down Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedScaleDown'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedScaleDown'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Scale X UP :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale X UP key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyScaleXUp'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyScaleXUp'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale X UP Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedScaleXUp'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedScaleXUp'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
+        ####################################################################
+        ####################################################################
+        # End of Keyboard control page
+        ####################################################################
+        ####################################################################
+        # Pack the mainFrame
+        frame = Frame(mainFrame)
+        Button(frame, text='OK', width = 13, command=self.ok_press).pack(side=RIGHT)
+        Button(frame, text='Enable Control', width = 13, command=self.enableControl).pack(side=LEFT)
+        Button(frame, text='Disable Control', width = 13, command=self.disableControl).pack(side=LEFT)
+        Button(frame, text='Save & Keep', width = 13, command=self.saveKeepControl).pack(side=LEFT)
+        frame.pack(side = BOTTOM, expand=1, fill = X)
+        mainFrame.pack(expand=1, fill = BOTH)
 
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Scale X Down:', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale X Down key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyScaleXDown'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyScaleXDown'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Down X Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedScaleXDown'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedScaleXDown'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
+        # Precompute the collection plan for the finished form.
+        self._buildKeyboardBindings()
 
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Scale Y UP :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Y UP key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyScaleYUp'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyScaleYUp'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Y UP Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedScaleYUp'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedScaleYUp'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
+        # Nothing the user did yet; edits made during construction (the
+        # initial selectitem calls) don't count.
+        self._dirty = False
 
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Scale Y Down:', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Y Down key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyScaleYDown'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyScaleYDown'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Down XY Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedScaleYDown'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedScaleYDown'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
+        # Show the finished window with a single layout pass.
+        self.parent.update_idletasks()
+        self.parent.deiconify()
 
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Scale Z UP :', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Z UP key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyScaleZUp'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyScaleZUp'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Z UP Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedScaleZUp'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedScaleZUp'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
+    def _makeKeyRow(self, parent, row, labelText, keyKey, speedKey):
+        ####################################################################
+        # _makeKeyRow(self, parent, row, labelText, keyKey, speedKey)
+        # Build one row of the keyboard setting page: a label, an entry
+        # for the key assignment and an entry for the moving speed.
+        # The widgets are gridded directly into the shared parent frame,
+        # so the rows don't need a container Frame each.
+        # The two entries are stored into self.widgetsDict using the
+        # keyboardMapDict/keyboardSpeedDict keys.
+        ####################################################################
+        Label(parent, text = labelText, width = 20, anchor = W).grid(
+            row = row, column = 0, sticky = W, pady = 2)
+        widget = self.createcomponent(
+            keyKey, (), None,
+            Pmw.EntryField, (parent,),
+            value = self.keyboardMapDict[keyKey],
+            **_KEY_OPTS)
+        widget.grid(row = row, column = 1, sticky = W, pady = 2)
+        widget.component('entry').bind('<KeyRelease>', self._markDirty)
+        self.widgetsDict[KEYBOARD+keyKey] = widget
+        self._mapWidgets[keyKey] = widget
+        widget = self.createcomponent(
+            speedKey, (), None,
+            Pmw.EntryField, (parent,),
+            value = self.keyboardSpeedDict[speedKey],
+            **_SPEED_OPTS)
+        widget.grid(row = row, column = 2, sticky = W, padx = 6, pady = 2)
+        widget.component('entry').bind('<KeyRelease>', self._markDirty)
+        self.widgetsDict[KEYBOARD+speedKey] = widget
+        self._speedWidgets[speedKey] = widget
+        return
 
-        Interior = Frame(settingFrame)
-        widget = Label(Interior, text = 'Scale Z Down:', width = 20, anchor = tkinter.W).pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Z Down key', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardMapDict['KeyScaleZDown'],
-            labelpos = tkinter.W, label_text='Key :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'KeyScaleZDown'] = widget
-        widget = Label(Interior, text = '   ').pack(side=tkinter.LEFT, expand = False)
-        widget = self.createcomponent(
-            'Scale Down Z Speed', (), None,
-            Pmw.EntryField, (Interior,),
-            value = self.keyboardSpeedDict['SpeedScaleZDown'],
-            labelpos = tkinter.W, label_text='Speed :', entry_width = 10)
-        widget.pack(side=tkinter.LEFT, expand = False)
-        self.widgetsDict[KEYBOARD+'SpeedScaleZDown'] = widget
-        widget = Label(Interior, text = 'Per Second').pack(side=tkinter.LEFT, expand = False)
-        Interior.pack(side=tkinter.TOP, fill=tkinter.X, expand=True, pady = 4 )
-
-        assignFrame.pack(side=tkinter.TOP, expand=True, fill = tkinter.X)
-        keyboardPage.pack(side=tkinter.TOP, expand=True, fill = tkinter.X)
+    def _buildKeyboardBindings(self):
+        ####################################################################
+        # _buildKeyboardBindings(self)
+        # Precompute one (key, widget, targetDict, cast) tuple per entry on
+        # the keyboard page, so collecting the form is a single flat loop
+        # with no per-key dict or attribute lookups. Must be rebuilt
+        # whenever the map/speed dicts are rebound (see showPanel).
+        ####################################################################
+        # A flat immutable tuple in the fixed KEYBOARD_ROWS order: the
+        # collection pass walks one contiguous structure instead of
+        # hashing its way through the two dicts.
+        self._keyboardBindings = tuple(
+            [(keyKey, self._mapWidgets[keyKey], self.keyboardMapDict, _keepValue)
+             for labelText, keyKey, speedKey in KEYBOARD_ROWS] +
+            [(speedKey, self._speedWidgets[speedKey], self.keyboardSpeedDict, _floatOrElse)
+             for labelText, keyKey, speedKey in KEYBOARD_ROWS])
+        # Payload reused for every dispatch; only the nodePath slot ever
+        # changes. Safe because the messenger and the direct callbacks
+        # both consume the payload synchronously.
+        self._keyboardPayload = ['Keyboard', [None, self.keyboardMapDict, self.keyboardSpeedDict]]
+        return
 
+    def _collectKeyboardState(self):
         ####################################################################
+        # _collectKeyboardState(self)
+        # Run the fused collection pass over the precomputed bindings and
+        # return the shared ['Keyboard', [nodePath, mapDict, speedDict]]
+        # payload with the nodePath slot refreshed.
         ####################################################################
-        # End of Keyboard control page
+        for index, widget, target, cast in self._keyboardBindings:
+            target[index] = cast(widget.getvalue(), target[index])
+        payload = self._keyboardPayload
+        payload[1][0] = self.nodePath
+        return payload
+
+    def registerDirectListener(self, event, callback):
         ####################################################################
+        # registerDirectListener(self, event, callback)
+        # Let the (single) receiver of one of the panel's events register
+        # a callback that is invoked directly instead of going through
+        # messenger.send's hashing and accept-list walk.
         ####################################################################
-        # Pack the mainFrame
-        frame = Frame(mainFrame)
-        widget = Button(frame, text='OK', width = 13, command=self.ok_press).pack(side=tkinter.RIGHT)
-        widget = Button(frame, text='Enable Control', width = 13, command=self.enableControl).pack(side=tkinter.LEFT)
-        widget = Button(frame, text='Disable Control', width = 13, command=self.disableControl).pack(side=tkinter.LEFT)
-        widget = Button(frame, text='Save & Keep', width = 13, command=self.saveKeepControl).pack(side=tkinter.LEFT)
-        frame.pack(side = tkinter.BOTTOM, expand=1, fill = tkinter.X)
-        mainFrame.pack(expand=1, fill = tkinter.BOTH)
+        self._directListeners[event] = callback
+
+    def _dispatch(self, event, args):
+        callback = self._directListeners.get(event)
+        if callback:
+            callback(*args)
+        else:
+            messenger.send(event, args)
+
+    def _markDirty(self, event = None):
+        self._dirty = True
 
     def onDestroy(self, event):
+        # Drop any deferred Save/Enable dispatch that hasn't run yet;
+        # once the widgets are gone the flush tasks would raise trying
+        # to read dead Tk entries. quit() flushes them first, so only a
+        # real destroy can actually lose one here.
+        taskMgr.remove('ctrlw-save')
+        taskMgr.remove('ctrlw-enable')
+        self._savePending = False
+        self._enablePending = False
         # Check if user wish to keep the control after the window closed.
-        if not self.keepControl:
+        # If nothing was touched there is nothing to tear down either.
+        if self._dirty and not self.keepControl:
             messenger.send('ControlW_controlDisable',[self.controllType])
         messenger.send('ControlW_close')
         '''
@@ -557,6 +401,60 @@ class controllerWindow(AppShell):
         '''
         pass
 
+    def quit(self):
+        ####################################################################
+        # quit(self)
+        # Hide the panel instead of destroying it, keeping the built form
+        # alive so that getOrCreateControllerWindow can reuse it the next
+        # time the panel is opened. The close notifications are sent just
+        # as if the window had been destroyed.
+        ####################################################################
+        # The widgets are still alive on this path, so run any deferred
+        # Save/Enable dispatch now instead of letting onDestroy drop it.
+        if self._savePending:
+            taskMgr.remove('ctrlw-save')
+            self._flushSave(None)
+        if self._enablePending:
+            taskMgr.remove('ctrlw-enable')
+            self._flushEnable(None)
+        self.onDestroy(None)
+        self.parent.withdraw()
+
+    def showPanel(self, listOfObj, controlType, dataList):
+        ####################################################################
+        # showPanel(self, listOfObj, controlType, dataList)
+        # Bring a hidden panel back with the given setting.
+        # Refreshes the object list and the key/speed entries with the
+        # values handed in, then deiconifies the window. No widgets are
+        # created in here.
+        ####################################################################
+        self.listOfObj = listOfObj
+        self.keepControl = False
+        self._dirty = False
+        if controlType == 'Keyboard':
+            self.nodePath = dataList[0]
+            self.nameOfNode = self.nodePath.getName()
+            self.controllType = 'Keyboard'
+            self.keyboardMapDict = dict(dataList[1])
+            self.keyboardSpeedDict = dict(dataList[2])
+            for index, widget in self._mapWidgets.items():
+                widget.setvalue(self.keyboardMapDict[index])
+            for index, widget in self._speedWidgets.items():
+                widget.setvalue(self.keyboardSpeedDict[index])
+            objList = self._objListEntry
+            objList.setlist(listOfObj)
+            self._lastNameList = tuple(listOfObj)
+            objList.selectitem(self.nameOfNode, setentry=True)
+            # The dicts were rebound above, so the collection plan has to
+            # point at the new ones.
+            self._buildKeyboardBindings()
+        # The panel may have been hidden while showing another page.
+        # Re-selecting the requested type runs setControllerType, which
+        # puts the matching page back up and syncs the combo entry.
+        self.cotrollerTypeEntry.selectitem(controlType, setentry=True)
+        self.parent.deiconify()
+        return
+
     def ok_press(self):
         ####################################################################
         # ok_press(self)
@@ -565,11 +463,7 @@ class controllerWindow(AppShell):
         # sceneEditor and close the window. It won't activate control at all.
         ####################################################################
         if self.controllType=='Keyboard':
-            for index in self.keyboardMapDict:
-                self.keyboardMapDict[index] = self.widgetsDict['Keyboard-'+index].getvalue()
-            for index in self.keyboardSpeedDict:
-                self.keyboardSpeedDict[index] = float(self.widgetsDict['Keyboard-'+index].getvalue())
-            messenger.send('ControlW_controlSetting', ['Keyboard', [self.nodePath, self.keyboardMapDict, self.keyboardSpeedDict]])
+            messenger.send('ControlW_controlSetting', self._collectKeyboardState())
         self.quit()
         return
 
@@ -585,20 +479,29 @@ class controllerWindow(AppShell):
         # the control process will be terminated when user closed the panel.
         ####################################################################
         if self.controllType=='Keyboard':
-            for index in self.keyboardMapDict:
-                self.keyboardMapDict[index] = self.widgetsDict['Keyboard-'+index].getvalue()
-            for index in self.keyboardSpeedDict:
-                self.keyboardSpeedDict[index] = float(self.widgetsDict['Keyboard-'+index].getvalue())
-            messenger.send('ControlW_controlEnable', ['Keyboard', [self.nodePath, self.keyboardMapDict, self.keyboardSpeedDict]])
+            # Control is running now, so closing the panel has real work
+            # to undo again.
+            self._dirty = True
+            if self._enablePending:
+                return
+            self._enablePending = True
+            taskMgr.doMethodLater(0, self._flushEnable, 'ctrlw-enable')
         return
 
+    def _flushEnable(self, task):
+        # Deferred half of enableControl: only the last click of a burst
+        # gathers the form and dispatches the event.
+        self._enablePending = False
+        self._dispatch('ControlW_controlEnable', self._collectKeyboardState())
+        return Task.done
+
     def disableControl(self):
         ####################################################################
         # disableControl(self)
         # This function will send out a message to sceneEditor to stop the
         # control task.
         ####################################################################
-        messenger.send('ControlW_controlDisable',[self.controllType])
+        self._dispatch('ControlW_controlDisable', [self.controllType])
         return
 
     def setControllerType(self, typeName = 'Keyboard'):
@@ -610,18 +513,42 @@ class controllerWindow(AppShell):
         # Basically, this function's job is to switch the notebook page to right one.
         #################################################################
         self.controllType = typeName
-        if self.controllType=='Keyboard':
-            self.objNotebook.selectpage('Keyboard')
-        elif self.controllType=='Tracker':
-            self.objNotebook.selectpage('Tracker')
+        page = self._PAGE_FOR_TYPE.get(typeName)
+        if page is None:
+            return
+        if page == 'Tracker' and not self._trackerBuilt:
+            self._buildTrackerPage()
+            self._trackerBuilt = True
+        self._selectPage(page)
+        return
 
+    def _selectPage(self, pageName):
+        #################################################################
+        # _selectPage(self, pageName)
+        # Show the given setting page, hiding the one currently shown.
+        # This replaces Pmw.NoteBook.selectpage for our tab-less pages.
+        #################################################################
+        page = self._pages[pageName]
+        current = self._currentPage
+        # Selecting the page that is already up is a no-op; don't repack.
+        if current is page:
+            return
+        if current is not None:
+            current.pack_forget()
+        page.pack(side = TOP, fill = 'both', expand = False)
+        self._currentPage = page
         return
 
-    def updateControlInfo(self, page=None):
+    def _buildTrackerPage(self):
         #################################################################
-        # Nothing. Unlike in the lighting panel, we don't have to keep data
-        # once user switch the page.
+        # _buildTrackerPage(self)
+        # Create the Tracker setting page.
+        # This is deferred until the user actually switches the controller
+        # type to 'Tracker,' so that opening the panel in the (default)
+        # Keyboard mode doesn't pay for the page creation.
         #################################################################
+        self._pages['Tracker'] = Frame(self.contentFrame)
+        # Tracker setting widgets will be created in here.
         return
 
     def setTargetObj(self, name = None, tracker = None):
@@ -633,7 +560,7 @@ class controllerWindow(AppShell):
             if name=='camera':
                 self.nodePath = camera
             else:
-                messenger.send('ControlW_require',[name])
+                self._dispatch('ControlW_require', [name])
         return
 
     def resetNameList(self, list, name = None, nodePath = None):
@@ -646,11 +573,17 @@ class controllerWindow(AppShell):
         # check if the name is equal to the name of current control target.
         # If so, it will change the name showed on panel.
         ####################################################################
-        self.widgetsDict['Keyboard-ObjList'].setlist(list)
+        # Rebuilding the scrolled list is O(n) Tcl work; skip it when the
+        # names haven't actually changed.
+        nameTuple = tuple(list)
+        if name == None and nameTuple == self._lastNameList:
+            return
+        self._lastNameList = nameTuple
+        self._objListEntry.setlist(list)
         if name != None:
             if self.nameOfNode == name:
                 self.nameOfNode = self.nodePath.getName()
-                self.widgetsDict['Keyboard-ObjList'].selectitem(self.nameOfNode, setentry=True)
+                self._objListEntry.selectitem(self.nameOfNode, setentry=True)
         return
 
     def setNodePathIn(self, nodePath):
@@ -685,12 +618,20 @@ class controllerWindow(AppShell):
         #################################################################
         self.keepControl = True
         if self.controllType=='Keyboard':
-            for index in self.keyboardMapDict:
-                self.keyboardMapDict[index] = self.widgetsDict['Keyboard-'+index].getvalue()
-            for index in self.keyboardSpeedDict:
-                self.keyboardSpeedDict[index] = float(self.widgetsDict['Keyboard-'+index].getvalue())
-            print(self.nodePath)
-            messenger.send('ControlW_saveSetting', ['Keyboard', [self.nodePath, self.keyboardMapDict, self.keyboardSpeedDict]])
+            if self._savePending:
+                return
+            self._savePending = True
+            taskMgr.doMethodLater(0, self._flushSave, 'ctrlw-save')
         return
 
+    def _flushSave(self, task):
+        # Deferred half of saveKeepControl: only the last click of a burst
+        # gathers the form and dispatches the event.
+        self._savePending = False
+        payload = self._collectKeyboardState()
+        if __debug__:
+            logger.debug('saving control setting for %s', self.nodePath)
+        self._dispatch('ControlW_saveSetting', payload)
+        return Task.done
+
 
@@ -1221,7 +1221,13 @@ class myLevelEditor(AppShell):
         if self.controllerPanel==None:
             list = AllScene.getAllObjNameAsList()
             type, dataList = AllScene.getControlSetting()
-            self.controllerPanel = controllerWindow(listOfObj = list, controlType = type, dataList = dataList)
+            self.controllerPanel = getOrCreateControllerWindow(listOfObj = list, controlType = type, dataList = dataList)
+            # These events all have exactly one receiver, so let the panel
+            # call us directly instead of going through the messenger.
+            self.controllerPanel.registerDirectListener('ControlW_controlEnable', self.startControl)
+            self.controllerPanel.registerDirectListener('ControlW_controlDisable', self.stopControl)
+            self.controllerPanel.registerDirectListener('ControlW_saveSetting', AllScene.saveControlSetting)
+            self.controllerPanel.registerDirectListener('ControlW_require', self.requestObjFromControlW)
         pass
 
     def closeInputPanel(self):